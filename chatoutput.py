@@ -1,9 +1,6 @@
 from collections.abc import Generator
 from typing import Any
 
-import orjson
-from fastapi.encoders import jsonable_encoder
-
 from langflow.base.io.chat import ChatComponent
 from langflow.helpers.data import safe_convert
 from langflow.inputs.inputs import BoolInput, DropdownInput, HandleInput, MessageTextInput
@@ -18,6 +15,10 @@ from langflow.utils.constants import (
     MESSAGE_SENDER_USER,
 )
 
+_VALID_INPUT_TYPES = (Message, Data, DataFrame, str, list, Generator, type(None))
+_EMPTY_VALUES = (None, "")
+_MISSING = object()
+
 
 class ChatOutput(ChatComponent):
     display_name = "Chat Output"
@@ -106,28 +107,26 @@ class ChatOutput(ChatComponent):
     ]
 
     def _build_source(self, id_: str | None, display_name: str | None, source: str | None) -> Source:
-        source_dict = {}
-        if id_:
-            source_dict["id"] = id_
-        if display_name:
-            source_dict["display_name"] = display_name
+        src_val = None
         if source:
-            if hasattr(source, "model_name"):
-                source_dict["source"] = source.model_name
-            elif hasattr(source, "model"):
-                source_dict["source"] = str(source.model)
-            else:
-                source_dict["source"] = str(source)
-        return Source(**source_dict)
+            src_val = getattr(source, "model_name", _MISSING)
+            if src_val is _MISSING:
+                model = getattr(source, "model", _MISSING)
+                src_val = str(source if model is _MISSING else model)
+        # Every field is built here from trusted values, so Pydantic validation can be skipped.
+        return Source.model_construct(**{k: v for k, v in (("id", id_), ("display_name", display_name), ("source", src_val)) if v})
+
+    def _pre_run_setup(self) -> None:
+        self._resolved_flow_id = getattr(getattr(self, "graph", None), "flow_id", None)
 
     async def message_response(self) -> Message:
         text = self.convert_to_string()
 
         source, icon, display_name, source_id = self.get_properties_from_source_component()
-        background_color = self.background_color
-        text_color = self.text_color
-        if self.chat_icon:
-            icon = self.chat_icon
+        background_color, text_color, chat_icon = self.background_color, self.text_color, self.chat_icon
+        sender, sender_name, session_id = self.sender, self.sender_name, self.session_id
+        if chat_icon:
+            icon = chat_icon
 
         if isinstance(self.input_value, Message):
             message = self.input_value
@@ -135,16 +134,20 @@ class ChatOutput(ChatComponent):
         else:
             message = Message(text=text)
 
-        message.sender = self.sender
-        message.sender_name = self.sender_name
-        message.session_id = self.session_id
-        message.flow_id = self.graph.flow_id if hasattr(self, "graph") else None
+        message.sender = sender
+        message.sender_name = sender_name
+        message.session_id = session_id
+        flow_id = getattr(self, "_resolved_flow_id", None)
+        if flow_id is None and hasattr(self, "graph"):
+            # _pre_run_setup was skipped; resolve it from the graph as before.
+            flow_id = self.graph.flow_id
+        message.flow_id = flow_id
         message.properties.source = self._build_source(source_id, display_name, source)
         message.properties.icon = icon
         message.properties.background_color = background_color
         message.properties.text_color = text_color
 
-        if self.session_id and self.should_store_message:
+        if session_id and self.should_store_message:
             stored_message = await self.send_message(message)
             self.message.value = stored_message
             message = stored_message
@@ -159,63 +162,73 @@ class ChatOutput(ChatComponent):
 
         payload = getattr(data, "data", None)
         if isinstance(payload, dict):
-            lines = []
-            for k, v in payload.items():
-                if v is None or v == "":
-                    continue
-                if isinstance(v, (dict, list)):
-                    try:
-                        v_str = str(v)
-                    except Exception:
-                        v_str = repr(v)
-                else:
-                    v_str = str(v)
-                lines.append(f"{k}: {v_str}")
+            lines = [f"{k}: {v!s}" for k, v in payload.items() if v not in _EMPTY_VALUES]
             return "\n".join(lines).strip() if lines else ""
 
-        try:
-            return str(data).strip()
-        except Exception:
-            return ""
+        return str(data).strip()
 
     def _validate_input(self) -> None:
         """Validate input types."""
         if self.input_value is None:
             raise ValueError("Input data cannot be None")
 
-        valid_types = (Message, Data, DataFrame, str, list, Generator, type(None))
-        if not isinstance(self.input_value, valid_types):
+        if not isinstance(self.input_value, _VALID_INPUT_TYPES):
             raise TypeError(f"Expected Data, DataFrame, Message, str, list, Generator or None, got {type(self.input_value).__name__}")
 
+    def _from_list(self, value: list) -> str:
+        sc, cd = safe_convert, self.clean_data
+        parts = [sc(item, clean_data=cd) for item in value]
+        return "\n".join(p.strip() for p in parts if p is not None)
+
+    def _from_message(self, value: Message) -> str | Generator[Any, None, None]:
+        text = value.text
+        if isinstance(text, str):
+            return text.strip()
+        # Streaming messages carry an (async) iterator; hand it on untouched.
+        return text if text is not None else ""
+
+    def _from_dataframe(self, value: DataFrame) -> str:
+        # langflow's DataFrame is a pandas DataFrame, so render it directly.
+        try:
+            return value.head().to_csv(sep="\t", index=False).rstrip("\r\n")
+        except Exception:
+            return str(value)
+
     def convert_to_string(self) -> str | Generator[Any, None, None]:
         """Convert input_value to readable plain text (line-by-line)."""
         self._validate_input()
 
-        if isinstance(self.input_value, list):
-            parts = []
-            for item in self.input_value:
-                parts.append(safe_convert(item, clean_data=self.clean_data))
-            return "\n".join(p.strip() for p in parts if p is not None)
+        value = self.input_value
+        name = self._DISPATCH.get(type(value))
+        if name is not None:
+            return getattr(self, name)(value)
 
-        if isinstance(self.input_value, Generator):
-            return self.input_value
+        if isinstance(value, str):
+            return value.strip()
 
-        if isinstance(self.input_value, Data):
-            return self._serialize_data(self.input_value)
+        if isinstance(value, list):
+            return self._from_list(value)
 
-        if isinstance(self.input_value, Message):
-            return (self.input_value.text or "").strip()
+        if isinstance(value, Generator):
+            return value
+
+        # Message subclasses Data, so it must be checked first.
+        if isinstance(value, Message):
+            return self._from_message(value)
+
+        if isinstance(value, Data):
+            return self._serialize_data(value)
 
-        if isinstance(self.input_value, DataFrame):
-            df_obj = getattr(self.input_value, "df", None) or getattr(self.input_value, "value", None)
-            if df_obj is not None:
-                try:
-                    return df_obj.head().to_string()
-                except Exception:
-                    return str(df_obj)
-            return str(self.input_value)
+        if isinstance(value, DataFrame):
+            return self._from_dataframe(value)
 
-        if isinstance(self.input_value, str):
-            return self.input_value.strip()
+        return safe_convert(value, clean_data=self.clean_data)
 
-        return safe_convert(self.input_value, clean_data=self.clean_data)
+    # Exact-type fast path for convert_to_string; subclasses fall through to the isinstance ladder.
+    # Handlers are looked up by name so overrides in subclasses apply to both paths.
+    _DISPATCH = {
+        Message: "_from_message",
+        Data: "_serialize_data",
+        DataFrame: "_from_dataframe",
+        list: "_from_list",
+    }